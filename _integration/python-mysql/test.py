@@ -24,18 +24,27 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import contextlib
 import unittest
-import mysql.connector
+import mysql.connector.pooling
 
 class TestMySQL(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = mysql.connector.pooling.MySQLConnectionPool(pool_name="it",
+                                                               pool_size=2,
+                                                               host='127.0.0.1',
+                                                               user='root',
+                                                               passwd='',
+                                                               database="mydb",
+                                                               use_pure=False,
+                                                               buffered=True)
+
     def test_connect(self):
-        connection = mysql.connector.connect(host='127.0.0.1',
-                                             user='root',
-                                             passwd='',
-                                             database="mydb")
+        connection = self.pool.get_connection()
 
-        try:
+        with contextlib.closing(connection):
             cursor = connection.cursor()
             sql = "SELECT name, email FROM mytable ORDER BY name, email"
             cursor.execute(sql)
@@ -49,8 +58,6 @@ class TestMySQL(unittest.TestCase):
             ]
 
             self.assertEqual(expected, rows)
-        finally:
-            connection.close()
 
 
 if __name__ == '__main__':
@@ -24,34 +24,43 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import itertools
 import unittest
 import pymysql.cursors
 
 class TestMySQL(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.connection = pymysql.connect(host='127.0.0.1',
+                                         user='root',
+                                         password='',
+                                         db='',
+                                         cursorclass=pymysql.cursors.SSDictCursor)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.connection.close()
+
     def test_connect(self):
-        connection = pymysql.connect(host='127.0.0.1',
-                                     user='root',
-                                     password='',
-                                     db='',
-                                     cursorclass=pymysql.cursors.DictCursor)
-
-        try:
-            with connection.cursor() as cursor:
-                sql = "SELECT name, email FROM mytable ORDER BY name, email"
-                cursor.execute(sql)
-                rows = cursor.fetchall()
-
-                expected = [
-                    {"name": "Evil Bob", "email": "evilbob@gmail.com"},
-                    {"name": "Jane Doe", "email": "jane@doe.com"},
-                    {"name": "John Doe", "email": "john@doe.com"},
-                    {"name": "John Doe", "email": "johnalt@doe.com"}
-                ]
-
-                self.assertEqual(expected, rows)
-        finally:
-            connection.close()
+        self.connection.ping(reconnect=True)
+
+        # SSDictCursor is unbuffered: rows are read from the socket as the
+        # cursor is iterated, so it must be fully drained before the
+        # connection issues another query.
+        with self.connection.cursor() as cursor:
+            sql = "SELECT name, email FROM mytable ORDER BY name, email"
+            cursor.execute(sql)
+
+            expected = [
+                {"name": "Evil Bob", "email": "evilbob@gmail.com"},
+                {"name": "Jane Doe", "email": "jane@doe.com"},
+                {"name": "John Doe", "email": "john@doe.com"},
+                {"name": "John Doe", "email": "johnalt@doe.com"}
+            ]
+
+            for want, got in itertools.zip_longest(expected, cursor):
+                self.assertEqual(want, got)
 
 
 if __name__ == '__main__':